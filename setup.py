@@ -1,15 +1,20 @@
+import re
+from pathlib import Path
+
 from setuptools import setup
 
 
 def get_long_description():
-    return open('README.rst').read() + "\n\n" + open('CHANGES.rst').read()
+    return "\n\n".join(
+        (Path('README.rst').read_text(), Path('CHANGES.rst').read_text()))
 
 
 def get_version():
-    with open('fern.py') as f:
-        for line in f:
-            if line.startswith('__version__ ='):
-                return line.split('=')[1].strip().strip('"\'')
+    return re.search(
+        r'^__version__\s*=\s*[\'"]([^\'"]+)',
+        Path('fern.py').read_text(),
+        re.MULTILINE,
+    ).group(1)
 
 
 setup(